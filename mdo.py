@@ -1,20 +1,54 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import sys
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from mdo_time import TaskTime, parse_time_input
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_STORE_PATH = Path(__file__).with_name("items.json")
 
+
+def _dump_store(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # orjson refuses lone surrogates (undecodable argv bytes) and integers
+            # beyond 64 bits; json writes both exactly.
+            pass
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _load_store(raw_bytes: bytes) -> Any:
+    # Always decode with json: orjson silently turns integers beyond 64 bits into
+    # floats and rejects the \udcXX escapes json writes for lone surrogates.
+    return json.loads(raw_bytes.decode("utf-8"))
+
+
+LEGACY_RECURRENCE = {
+    "daily": 1,
+    "day": 1,
+    "everyday": 1,
+    "every day": 1,
+}
+
 class Task:
+    __slots__ = ("id", "title", "parent_id", "children", "time", "recurrence")
+
     id: int
     title: str
     parent_id: Optional[int]
-    children: Set[int]
+    children: List[int]
     time: Optional[TaskTime]
     recurrence: Optional[int]
 
@@ -36,10 +70,11 @@ class Task:
         self.id = id
         self.title = title
         self.parent_id = parent_id
-        self.children = set()
+        self.children = []
         self.time = time
         self.recurrence = recurrence
 
+    # Kept for external API compatibility; mdo itself tests the attributes directly.
     def is_subtask(self) -> bool:
         return self.parent_id is not None
     
@@ -69,45 +104,40 @@ class Task:
                 recurrence = raw_recurrence if raw_recurrence > 0 else None
             elif isinstance(raw_recurrence, str):
                 alias = raw_recurrence.strip().lower()
-                legacy = {
-                    "daily": 1,
-                    "day": 1,
-                    "everyday": 1,
-                    "every day": 1,
-                }
-                if alias in legacy:
-                    recurrence = legacy[alias]
-                else:
-                    try:
-                        parsed = int(alias)
-                        if parsed > 0:
-                            recurrence = parsed
-                    except ValueError:
-                        recurrence = None
+                recurrence = LEGACY_RECURRENCE.get(alias)
+                # Only plain digit strings count; int()-only forms like "+3" or "1_0" are dropped.
+                if recurrence is None and alias.isdecimal():
+                    parsed = int(alias)
+                    if parsed > 0:
+                        recurrence = parsed
         return Task(id=id, title=title, parent_id=parent_id, time=time, recurrence=recurrence)
 
-    def __str__(self) -> str:
-        label = f"{self.id}: {self.title}"
+    def _label(self, name: str) -> str:
+        parts = [f"{self.id}: {name}"]
         if self.time:
-            label = f"{label} [{self.time}]"
+            parts.append(f" [{self.time}]")
         if self.recurrence:
-            label = f"{label} (repeat every {self.recurrence} day(s))"
-        if self.have_subtask():
-            return f"{label} (has {len(self.children)} subtasks)"
-        else:
-            return label
+            parts.append(f" (repeat every {self.recurrence} day(s))")
+        if self.children:
+            parts.append(f" (has {len(self.children)} subtasks)")
+        return "".join(parts)
+
+    def __str__(self) -> str:
+        return self._label(self.title)
     
 class AppData:
+    __slots__ = ("tasks", "fresh_id", "store_path", "today")
+
     tasks: Dict[int, Task]
     fresh_id: int
     store_path: Path
-    _today: Optional[date]
+    today: date
 
     def __init__(self, store_path: Path, today: Optional[date] = None) -> None:
         self.store_path = store_path
         self.tasks = {}
         self.fresh_id = 0
-        self._today = today
+        self.today = today if today is not None else date.today()
 
     def to_json(self) -> Dict[str, Any]:
         return {"tasks": [self.tasks[task_id].to_json() for task_id in self.tasks]}
@@ -121,31 +151,39 @@ class AppData:
     def save(self) -> None:
         payload = self.to_json()
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        self.store_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self.store_path.write_bytes(_dump_store(payload))
 
     def load(self) -> None:
         if not self.store_path.exists():
             return
 
-        raw_text = self.store_path.read_text(encoding="utf-8")
-        if not raw_text.strip():
+        raw_bytes = self.store_path.read_bytes()
+        if not raw_bytes.strip():
             return
     
-        data = json.loads(raw_text)
+        data = _load_store(raw_bytes)
         self.from_json(data)
         self.fix()
     
     def fix(self) -> None:
-        for task_id, task in list(self.tasks.items()):
-            if task.parent_id is not None:
-                if task.parent_id not in self.tasks:
-                    del self.tasks[task_id]
-                else:
-                    self.tasks[task.parent_id].children.add(task.id)
-            for child_id in list(task.children):
-                if child_id not in self.tasks:
-                    task.children.remove(child_id)
-            self.fresh_id = max(self.fresh_id, task_id + 1)
+        # Children are derived from parent_id links, so rebuild them in one pass
+        # and drop every task whose parent chain is broken, along with its subtree.
+        tasks = self.tasks
+        self.fresh_id = max(self.fresh_id, max(tasks, default=-1) + 1)
+        for task in tasks.values():
+            task.children.clear()
+        orphans: List[int] = []
+        for task in tasks.values():
+            if task.parent_id is None:
+                continue
+            parent = tasks.get(task.parent_id)
+            if parent is None:
+                orphans.append(task.id)
+            else:
+                parent.children.append(task.id)
+        while orphans:
+            orphan = tasks.pop(orphans.pop())
+            orphans.extend(orphan.children)
 
     def get_id(self) -> int:
         ret = self.fresh_id
@@ -157,6 +195,7 @@ class AppData:
         self.fresh_id = 0
 
     def _task_title_stack(self, task: Task) -> List[str]:
+        get = self.tasks.get
         titles: List[str] = []
         current: Optional[Task] = task
         visited: Set[int] = set()
@@ -165,60 +204,75 @@ class AppData:
             visited.add(current.id)
             if current.parent_id is None:
                 break
-            current = self.tasks.get(current.parent_id)
+            current = get(current.parent_id)
         return list(reversed(titles))
 
-    def _format_stack_path(self, task: Task) -> str:
-        return " > ".join(self._task_title_stack(task))
+    def _format_stack_path(self, task: Task, paths: Optional[Dict[int, str]] = None) -> str:
+        if paths is None:
+            return " > ".join(self._task_title_stack(task))
+        # Walk up only until an ancestor whose path is already known, then
+        # extend that prefix downwards so each ancestor is formatted once.
+        get = self.tasks.get
+        chain: List[Task] = []
+        visited: Set[int] = set()
+        current: Optional[Task] = task
+        while current is not None and current.id not in paths:
+            if current.id in visited:
+                return " > ".join(self._task_title_stack(task))
+            visited.add(current.id)
+            chain.append(current)
+            current = None if current.parent_id is None else get(current.parent_id)
+        path = paths[current.id] if current is not None else None
+        for node in reversed(chain):
+            path = node.title if path is None else f"{path} > {node.title}"
+            paths[node.id] = path
+        return path
 
-    def _format_task_display(self, task: Task) -> str:
-        stack = self._format_stack_path(task)
-        if task.time:
-            stack = f"{stack} [{task.time}]"
-        if task.recurrence:
-            stack = f"{stack} (repeat every {task.recurrence} day(s))"
-        if task.have_subtask():
-            return f"{task.id}: {stack} (has {len(task.children)} subtasks)"
-        return f"{task.id}: {stack}"
+    def _format_task_display(self, task: Task, paths: Optional[Dict[int, str]] = None) -> str:
+        return task._label(self._format_stack_path(task, paths))
 
     def list(self, at:Optional[int]=None) -> None:
+        paths: Dict[int, str] = {}
         if at is None:
-            tasks = [task for task in self.tasks.values() if not task.is_subtask()]
+            tasks = [task for task in self.tasks.values() if task.parent_id is None]
             context_label = "root"
         else:
-            parent = self.tasks.get(at)
+            all_tasks = self.tasks
+            parent = all_tasks.get(at)
             if parent is None:
                 print(f"Task {at} not found.")
                 return
-            tasks = [self.tasks[child_id] for child_id in parent.children if child_id in self.tasks]
-            context_label = self._format_stack_path(parent)
+            tasks = [all_tasks[child_id] for child_id in parent.children if child_id in all_tasks]
+            context_label = self._format_stack_path(parent, paths)
         tasks.sort(key=lambda task: task.id)
         if not tasks:
             print(f"{context_label} (no tasks)")
             return
-        print(f"{context_label}, tasks count: {len(tasks)}")
-        for task in tasks:
-            print(self._format_task_display(task))
+        lines = [f"{context_label}, tasks count: {len(tasks)}"]
+        lines.extend(self._format_task_display(task, paths) for task in tasks)
+        print("\n".join(lines))
     
     def list_today(self) -> None:
-        today = self._today or date.today()
+        today = self.today
         tasks = [task for task in self.tasks.values() if task.time is not None and task.time.day <= today]
         tasks.sort(key=lambda task: (task.time.day, task.id))
         if not tasks:
             print("today (no tasks)")
             return
-        print(f"today, tasks count: {len(tasks)}")
-        for task in tasks:
-            print(self._format_task_display(task))
+        paths: Dict[int, str] = {}
+        lines = [f"today, tasks count: {len(tasks)}"]
+        lines.extend(self._format_task_display(task, paths) for task in tasks)
+        print("\n".join(lines))
 
     def move(self, task_id: int, new_parent_id: Optional[int]) -> bool:
-        task = self.tasks.get(task_id)
+        tasks = self.tasks
+        task = tasks.get(task_id)
         if task is None:
             print(f"Task {task_id} not found.")
             return False
 
         if new_parent_id is not None:
-            parent = self.tasks.get(new_parent_id)
+            parent = tasks.get(new_parent_id)
             if parent is None:
                 print(f"Task {new_parent_id} not found.")
                 return False
@@ -230,19 +284,21 @@ class AppData:
                 if ancestor.id == task_id:
                     print("Cannot move a task into its own subtask hierarchy.")
                     return False
-                ancestor = self.tasks.get(ancestor.parent_id)
+                ancestor = tasks.get(ancestor.parent_id)
 
         if task.parent_id == new_parent_id:
             print("Task already under the requested parent.")
             return False
 
         old_parent_id = task.parent_id
-        if old_parent_id is not None and old_parent_id in self.tasks:
-            self.tasks[old_parent_id].children.discard(task_id)
+        if old_parent_id is not None and old_parent_id in tasks:
+            old_siblings = tasks[old_parent_id].children
+            if task_id in old_siblings:
+                old_siblings.remove(task_id)
 
         task.parent_id = new_parent_id
         if new_parent_id is not None:
-            self.tasks[new_parent_id].children.add(task_id)
+            tasks[new_parent_id].children.append(task_id)
 
         print(f"Moved {task}.")
         if old_parent_id is not None and old_parent_id != new_parent_id:
@@ -265,7 +321,7 @@ class AppData:
             task.time = None
             print(f"Cleared time for {task}.")
         else:
-            base_day = self._today or date.today()
+            base_day = self.today
             parsed_time, recurrence = parse_time_input(time_value, base_day)
             if parsed_time is None:
                 print("Invalid date. Please use YYYY-MM-DD, MM-DD, DD, weekday names, or recurrence phrases.")
@@ -303,14 +359,14 @@ class AppData:
         if task is None:
             print(f"Task {id} not found.")
             return False, None
-        if task.have_subtask():
+        if task.children:
             print("cannot do task with subtasks. Please do subtasks first.")
             self.list(at=id)
             return False, None
 
         if task.recurrence is not None:
             before_display = str(task)
-            base_day = task.time.day if task.time else (self._today or date.today())
+            base_day = task.time.day if task.time else self.today
             next_day = base_day + timedelta(days=task.recurrence)
             task.time = TaskTime(next_day)
             print(f"Done {before_display}.")
@@ -318,8 +374,10 @@ class AppData:
             return True, task.parent_id
 
         parent_id = task.parent_id
-        if task.is_subtask() and parent_id in self.tasks:
-            self.tasks[parent_id].children.discard(id)
+        if parent_id is not None and parent_id in self.tasks:
+            siblings = self.tasks[parent_id].children
+            if id in siblings:
+                siblings.remove(id)
         del self.tasks[id]
         print(f"Done {task}.")
         return True, parent_id
@@ -335,7 +393,7 @@ class App:
         task = Task(id=task_id, title=title, parent_id=parent_id)
         self.data.tasks[task_id] = task
         if parent_id is not None and parent_id in self.data.tasks:
-            self.data.tasks[parent_id].children.add(task_id)
+            self.data.tasks[parent_id].children.append(task_id)
         self.data.save()
         print(f"Added {task}.")
 
@@ -369,62 +427,114 @@ class App:
         if self.data.set_recurrence(id, interval):
             self.data.save()
 
-    def build_parser(self) -> argparse.ArgumentParser:
-        parser = argparse.ArgumentParser(prog="mdo", description="Simple list manager.")
-        subparsers = parser.add_subparsers(dest="command", required=True)
-
-        add_parser = subparsers.add_parser("add", help="Append a string to the list.")
-        add_parser.add_argument("text", help="Text to store.")
-        add_parser.add_argument("parent", nargs="?", help="parent id", default=None, type=int)
-        add_parser.set_defaults(func=lambda args: self.cmd_add(args.text, args.parent))
-
-        clear_parser = subparsers.add_parser("clear", help="Clear all stored items.")
-        clear_parser.set_defaults(func=lambda args: self.cmd_clear())
-
-        list_parser = subparsers.add_parser("list", help="Show all stored items.")
-        list_parser.add_argument("at", nargs="?", help="list subtasks from id:", default=None, type=int)
-        list_parser.set_defaults(func=lambda args: self.cmd_list(args.at))
-
-        today_parser = subparsers.add_parser("today", help="Show tasks due today or overdue.")
-        today_parser.set_defaults(func=lambda args: self.cmd_today())
-
-        do_parser = subparsers.add_parser("do", help="do task")
-        do_parser.add_argument("id", help="task id to do", type=int)
-        do_parser.set_defaults(func=lambda args: self.cmd_do(args.id))
-
-        move_parser = subparsers.add_parser("move", help="Move a task under a new parent (or root).")
-        move_parser.add_argument("id", help="task id to move", type=int)
-        move_parser.add_argument("parent", nargs="?", help="new parent id (omit for root)", default=None, type=int)
-        move_parser.set_defaults(func=lambda args: self.cmd_move(args.id, args.parent))
-
-        settime_parser = subparsers.add_parser("settime", help="Set or clear the due date for a task.")
-        settime_parser.add_argument("id", help="task id to update", type=int)
-        settime_parser.add_argument(
-            "time",
-            nargs="?",
-            help="date value (YYYY-MM-DD, MM-DD, or DD; omit to clear)",
-            default=None,
-        )
-        settime_parser.set_defaults(func=lambda args: self.cmd_settime(args.id, args.time))
-        repeat_parser = subparsers.add_parser("repeat", help="Set or clear recurrence for a task.")
-        repeat_parser.add_argument("id", help="task id to update", type=int)
-        repeat_parser.add_argument(
-            "interval",
-            nargs="?",
-            type=int,
-            help="number of days between occurrences (omit to clear)",
-            default=None,
-        )
-        repeat_parser.set_defaults(func=lambda args: self.cmd_repeat(args.id, args.interval))
-        return parser
+    def build_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
+        return build_parser(command)
 
     def run(self, argv: Optional[List[str]] = None) -> int:
-        parser = self.build_parser()
-        args = parser.parse_args(argv)
-        args.func(args)
+        if argv is None:
+            argv = sys.argv[1:]
+        parser = self.build_parser(argv[0] if argv else None)
+        args, extras = parser.parse_known_args(argv)
+        if extras:
+            # Stray arguments are reported by the top-level parser, so let the
+            # full parser produce the error with its complete usage line.
+            args = self.build_parser().parse_args(argv)
+        args.func(self, args)
         return 0
 
 
+def _add_add_parser(subparsers: argparse._SubParsersAction) -> None:
+    add_parser = subparsers.add_parser("add", help="Append a string to the list.")
+    add_parser.add_argument("text", help="Text to store.")
+    add_parser.add_argument("parent", nargs="?", help="parent id", default=None, type=int)
+    add_parser.set_defaults(func=lambda app, args: app.cmd_add(args.text, args.parent))
+
+
+def _add_clear_parser(subparsers: argparse._SubParsersAction) -> None:
+    clear_parser = subparsers.add_parser("clear", help="Clear all stored items.")
+    clear_parser.set_defaults(func=lambda app, args: app.cmd_clear())
+
+
+def _add_list_parser(subparsers: argparse._SubParsersAction) -> None:
+    list_parser = subparsers.add_parser("list", help="Show all stored items.")
+    list_parser.add_argument("at", nargs="?", help="list subtasks from id:", default=None, type=int)
+    list_parser.set_defaults(func=lambda app, args: app.cmd_list(args.at))
+
+
+def _add_today_parser(subparsers: argparse._SubParsersAction) -> None:
+    today_parser = subparsers.add_parser("today", help="Show tasks due today or overdue.")
+    today_parser.set_defaults(func=lambda app, args: app.cmd_today())
+
+
+def _add_do_parser(subparsers: argparse._SubParsersAction) -> None:
+    do_parser = subparsers.add_parser("do", help="do task")
+    do_parser.add_argument("id", help="task id to do", type=int)
+    do_parser.set_defaults(func=lambda app, args: app.cmd_do(args.id))
+
+
+def _add_move_parser(subparsers: argparse._SubParsersAction) -> None:
+    move_parser = subparsers.add_parser("move", help="Move a task under a new parent (or root).")
+    move_parser.add_argument("id", help="task id to move", type=int)
+    move_parser.add_argument("parent", nargs="?", help="new parent id (omit for root)", default=None, type=int)
+    move_parser.set_defaults(func=lambda app, args: app.cmd_move(args.id, args.parent))
+
+
+def _add_settime_parser(subparsers: argparse._SubParsersAction) -> None:
+    settime_parser = subparsers.add_parser("settime", help="Set or clear the due date for a task.")
+    settime_parser.add_argument("id", help="task id to update", type=int)
+    settime_parser.add_argument(
+        "time",
+        nargs="?",
+        help="date value (YYYY-MM-DD, MM-DD, or DD; omit to clear)",
+        default=None,
+    )
+    settime_parser.set_defaults(func=lambda app, args: app.cmd_settime(args.id, args.time))
+
+
+def _add_repeat_parser(subparsers: argparse._SubParsersAction) -> None:
+    repeat_parser = subparsers.add_parser("repeat", help="Set or clear recurrence for a task.")
+    repeat_parser.add_argument("id", help="task id to update", type=int)
+    repeat_parser.add_argument(
+        "interval",
+        nargs="?",
+        type=int,
+        help="number of days between occurrences (omit to clear)",
+        default=None,
+    )
+    repeat_parser.set_defaults(func=lambda app, args: app.cmd_repeat(args.id, args.interval))
+
+
+SUBCOMMANDS: Dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "add": _add_add_parser,
+    "clear": _add_clear_parser,
+    "list": _add_list_parser,
+    "today": _add_today_parser,
+    "do": _add_do_parser,
+    "move": _add_move_parser,
+    "settime": _add_settime_parser,
+    "repeat": _add_repeat_parser,
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    # Unknown words all share the full parser, so the cache holds at most one
+    # entry per subcommand plus one for the full parser.
+    return _build_parser(command if command in SUBCOMMANDS else None)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mdo", description="Simple list manager.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    # A known command only needs its own subparser; the full parser (no command,
+    # --help, typos) registers all of them so usage and errors list every choice.
+    if command is not None:
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subparser in SUBCOMMANDS.values():
+            add_subparser(subparsers)
+    return parser
+
 def main(argv: Optional[List[str]] = None) -> int:
     app = App()
     return app.run(argv)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Optional, Tuple
@@ -30,6 +31,21 @@ WEEKDAY_MAP = {
     "su": 6,
 }
 
+# Phrases that need no further parsing: (day offset from today, recurrence).
+FIXED_PHRASES = {
+    "daily": (0, 1),
+    "everyday": (0, 1),
+    "every day": (0, 1),
+    "today": (0, None),
+    "tomorrow": (1, None),
+}
+
+# "in N [day|days]" and "every N day|days", matched against lowered input.
+# The keyword and the day suffix need a literal space, as the old prefix checks did.
+RELATIVE_DAYS_RE = re.compile(
+    r"in \s*(?P<offset>[+-]?\d+)(?:\s* days?)?|every \s*(?P<interval>[+-]?\d+)\s* days?"
+)
+
 
 @dataclass(frozen=True)
 class TaskTime:
@@ -58,28 +74,26 @@ def parse_time_input(raw: str, today: date) -> Tuple[Optional[TaskTime], Optiona
             return None, None
         lowered = value.lower()
 
-        if lowered in {"daily", "everyday", "every day"}:
-            return TaskTime(today), 1
-
-        if lowered == "today":
-            return TaskTime(today), None
-
-        if lowered == "tomorrow":
-            return TaskTime(today + timedelta(days=1)), None
+        fixed = FIXED_PHRASES.get(lowered)
+        if fixed is not None:
+            offset, recurrence = fixed
+            return TaskTime(today + timedelta(days=offset)), recurrence
+
+        relative = RELATIVE_DAYS_RE.fullmatch(lowered)
+        if relative is not None:
+            offset = relative.group("offset")
+            if offset is not None:
+                days = int(offset)
+                if days < 0:
+                    return None, None
+                return TaskTime(today + timedelta(days=days)), None
+            interval = int(relative.group("interval"))
+            if interval <= 0:
+                return None, None
+            return TaskTime(today + timedelta(days=interval)), interval
 
         if lowered.startswith("in "):
-            remainder = lowered[3:].strip()
-            if remainder.endswith(" days"):
-                remainder = remainder[:-5].strip()
-            elif remainder.endswith(" day"):
-                remainder = remainder[:-4].strip()
-            try:
-                offset = int(remainder)
-            except ValueError:
-                return None, None
-            if offset < 0:
-                return None, None
-            return TaskTime(today + timedelta(days=offset)), None
+            return None, None
 
         if lowered.startswith("every "):
             remainder = lowered[6:].strip()
@@ -88,14 +102,6 @@ def parse_time_input(raw: str, today: date) -> Tuple[Optional[TaskTime], Optiona
             weekday = _match_weekday(remainder)
             if weekday is not None:
                 return TaskTime(_next_weekday(today, weekday)), 7
-            if remainder.endswith(" days") or remainder.endswith(" day"):
-                number = remainder.split()[0]
-                try:
-                    interval = int(number)
-                except ValueError:
-                    interval = None
-                if interval is not None and interval > 0:
-                    return TaskTime(today + timedelta(days=interval)), interval
             return None, None
 
         weekday = _match_weekday(lowered)
@@ -127,8 +133,8 @@ def parse_time_input(raw: str, today: date) -> Tuple[Optional[TaskTime], Optiona
         return None, None
 
 
-def _match_weekday(text: str) -> Optional[int]:
-    return WEEKDAY_MAP.get(text.strip().lower())
+def _match_weekday(lowered: str) -> Optional[int]:
+    return WEEKDAY_MAP.get(lowered)
 
 
 def _next_weekday(current: date, target_weekday: int) -> date:
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import argparse
 import shlex
+import shutil
 import sys
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 # Ensure the project root is importable when running as a script.
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -25,24 +26,25 @@ class GoldenCase:
     name: str
     input_path: Path
     output_path: Path
-
-    def load_commands(self) -> List[List[str]]:
-        text = self.input_path.read_text(encoding="utf-8")
-        lines = text.splitlines()
-        commands: List[List[str]] = []
-        for raw_line in lines:
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith("#"):
-                continue
-            commands.append(shlex.split(raw_line, posix=True))
-        if not commands:
-            commands.append([])
-        return commands
+    store_seed_path: Optional[Path] = None
+
+    def load_commands(self) -> Iterator[List[str]]:
+        emitted = False
+        # surrogateescape lets fixtures carry raw non-UTF-8 bytes, as POSIX argv would.
+        with self.input_path.open("r", encoding="utf-8", errors="surrogateescape") as lines:
+            for raw_line in lines:
+                stripped = raw_line.strip()
+                if not stripped:
+                    continue
+                if stripped.startswith("#"):
+                    continue
+                emitted = True
+                yield shlex.split(raw_line, posix=True)
+        if not emitted:
+            yield []
 
     def load_expected_output(self) -> str:
-        return self.output_path.read_text(encoding="utf-8").strip()
+        return self.output_path.read_text(encoding="utf-8", errors="surrogateescape").strip()
 
 class GoldenRunner:
     def __init__(self, fixtures_dir: Path) -> None:
@@ -53,8 +55,16 @@ class GoldenRunner:
         for input_path in sorted(self.fixtures_dir.glob("*.in.txt")):
             base = input_path.stem[:-3] if input_path.stem.endswith(".in") else input_path.stem
             output_path = self.fixtures_dir / f"{base}.out.txt"
+            store_seed_path = self.fixtures_dir / f"{base}.store.json"
             if output_path.exists():
-                cases.append(GoldenCase(name=base, input_path=input_path, output_path=output_path))
+                cases.append(
+                    GoldenCase(
+                        name=base,
+                        input_path=input_path,
+                        output_path=output_path,
+                        store_seed_path=store_seed_path if store_seed_path.exists() else None,
+                    )
+                )
         return cases
 
     def run_all(self, store_dir: Path) -> int:
@@ -77,7 +87,8 @@ def capture_output(case: GoldenCase, store_dir: Path) -> str:
     store_file = store_dir / f"{case.name}.json"
     if store_file.exists():
         store_file.unlink()
-    commands = case.load_commands()
+    if case.store_seed_path is not None:
+        shutil.copyfile(case.store_seed_path, store_file)
     saved_stdout = sys.stdout
     saved_stderr = sys.stderr
     try:
@@ -86,7 +97,7 @@ def capture_output(case: GoldenCase, store_dir: Path) -> str:
         buffer = StringIO()
         sys.stdout = buffer
         sys.stderr = buffer
-        for args in commands:
+        for args in case.load_commands():
             app = App(store_path=store_file, today=FIXED_TODAY)
             try:
                 app.run(args)